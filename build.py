@@ -33,15 +33,17 @@ def get_page_paths(path=None):
     md_pages = {}
     if path is None:
         path = os.path.join(os.getcwd(), "content")
-    directories = os.listdir(path)
-    for item in directories:
-        item_path = os.path.join(path, item)
-        if os.path.isdir(item_path):
-            # add items from new dict into md_pages
-            md_pages.update(get_page_paths(item_path))
-        else:
-            if not item == "README.md" and item.endswith(".md"):
-                md_pages[item] = item_path
+    # scandir yields entries with cached type information, avoiding a
+    # separate stat call per item
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                # add items from new dict into md_pages
+                md_pages.update(get_page_paths(entry.path))
+            else:
+                if not entry.name == "README.md" \
+                        and entry.name.endswith(".md"):
+                    md_pages[entry.name] = entry.path
 
     return md_pages
 
@@ -304,10 +306,12 @@ def main():
 
     content_path = os.path.join(os.getcwd(), "content")
     hash_path = os.path.join(os.getcwd(), "scripts", "notebook_hashes.json")
+    cache_path = os.path.join(os.getcwd(), "scripts", ".nb_cache")
 
     convert_notebooks_to_html(
         input_folder=content_path,
         hash_path=hash_path,
+        cache_dir=cache_path,
         write_html=True,
         execute_notebooks=args.execute_notebooks,
     )
@@ -1,82 +1,128 @@
 # %%
 import os
-import base64
-import html
 import re
 import json
 import nbformat
 # import markdown
 import hashlib
 import pypandoc
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from nbconvert.preprocessors import (
     ExecutePreprocessor,
     ClearOutputPreprocessor,
 )
 
+# use the SIMD-accelerated pybase64 decoder when it is installed; it is
+# a drop-in replacement for the stdlib function
+try:
+    from pybase64 import b64decode
+except ImportError:
+    from base64 import b64decode
+
+# orjson serializes notebook-sized json considerably faster than the
+# stdlib encoder; fall back to stdlib json when it is not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# regex for header lines such as '<h2>Title</h2>', compiled once at
+# import time rather than on every call
+_HEADER_RE = re.compile(r'(<h[1-6]>)(.*?)(</h[1-6]>)')
+
+# translation table equivalent to html.escape(s, quote=True); a single
+# str.translate pass replaces the several str.replace passes html.escape
+# makes
+_HTML_ESCAPE_TABLE = str.maketrans({
+    '&': '&amp;',
+    '<': '&lt;',
+    '>': '&gt;',
+    '"': '&quot;',
+    "'": '&#x27;',
+})
+
+
+# number of base64 characters decoded per chunk when writing images;
+# must be a multiple of 4, the base64 quantum
+_B64_CHUNK_SIZE = 1 << 20
+
 
 def save_plot_as_image(img_data, img_filename, output_dir):
     """Saves the plot image to the specified directory."""
     img_path = os.path.join(output_dir, img_filename)
+
+    # strip any line breaks so fixed-size chunks stay aligned to the
+    # 4-character quantum
+    if "\n" in img_data or "\r" in img_data:
+        img_data = "".join(img_data.split())
+
+    # decode and write in chunks to avoid holding both the full
+    # encoded and decoded payloads in memory at once
     with open(img_path, "wb") as img_file:
-        img_file.write(base64.b64decode(img_data))
+        for i in range(0, len(img_data), _B64_CHUNK_SIZE):
+            img_file.write(
+                b64decode(img_data[i:i + _B64_CHUNK_SIZE])
+            )
     return
 
 
-def html_to_json(html: str, filename: str):
+def html_to_json(html, filename: str, headers=None):
     """
     Convert html into hierarchical json
+
+    `html` may be a full document string or the list of fragments
+    returned by `extract_html_from_notebook`; passing the fragments
+    avoids materializing the joined document.
+
+    `headers` optionally provides the list of (line number, level,
+    title) tuples returned by `extract_html_from_notebook`; when given,
+    the scan for header lines is skipped.
     """
     # variable for processed json output
     contents = {filename: {}}
 
-    # variable to track section content and metadata
-    current_html = None
-    current_title = None
-    current_level = None
-
-    # split html into lines while replacing tabs with spaces
-    lines = [
-        line.replace("\t", "    ")
-        for line in html.splitlines()
-        # if line.strip()
-    ]
-
-    for i, line in enumerate(lines):
-        # identify lines with header tag
+    # split html into lines while replacing tabs with spaces; the
+    # replacement is done once per string rather than per-line
+    if isinstance(html, str):
+        lines = html.replace("\t", "    ").split("\n")
+    else:
+        # fragments are joined with newlines in the rendered document,
+        # so extending with each fragment's lines is equivalent to
+        # splitting the joined string
+        lines = []
+        for fragment in html:
+            lines.extend(fragment.replace("\t", "    ").split("\n"))
+
+    if headers is None:
+        # single pass to record the line number, level, and title of
+        # each header
         # note: the match is performed on the line stripped of any
-        # spaces or newlines
-        line_match = re.match(r'(<h[1-6]>)(.*?)(</h[1-6]>)', line.strip())
-
-        if line_match:
-            # when a new header is found, save the previous section
-            if current_title:
-                contents[filename][current_title] = {}
-                contents[filename][current_title]['level'] = current_level
-                contents[filename][current_title]['html'] = \
-                    '\n'.join(current_html)
-
-            # get the title, level of the new section
-            current_level = line_match.group(1).strip()
-            current_level = int(current_level.lstrip('<h').rstrip('>'))
-            current_title = line_match.group(2).strip()
-
-            # start a new section with the previous line
-            current_html = [lines[i-1]]
-
-        elif current_html is not None:
-            # add new html lines
-            current_html.append(lines[i-1])
-
-    # save the last section
-    if current_title:
-        # append the last line
-        current_html.append(line)
-
-        # update contants
-        contents[filename][current_title] = {}
-        contents[filename][current_title]['level'] = current_level
-        contents[filename][current_title]['html'] = \
-            '\n'.join(current_html)
+        # spaces or newlines; the substring test filters out the vast
+        # majority of lines before the regex runs
+        headers = []
+        for i, line in enumerate(lines):
+            if '<h' in line:
+                line_match = _HEADER_RE.match(line.strip())
+                if line_match:
+                    level = line_match.group(1).strip()
+                    level = int(level.lstrip('<h').rstrip('>'))
+                    title = line_match.group(2).strip()
+                    headers.append((i, level, title))
+
+    # each section starts one line before its header, which captures the
+    # enclosing markdown-cell div, and runs up to one line before the
+    # next header (or to the end of the document for the last section)
+    for n, (i, level, title) in enumerate(headers):
+        start = max(i - 1, 0)
+        if n + 1 < len(headers):
+            end = headers[n + 1][0] - 1
+        else:
+            end = len(lines)
+
+        contents[filename][title] = {}
+        contents[filename][title]['level'] = level
+        contents[filename][title]['html'] = '\n'.join(lines[start:end])
 
     return contents
 
@@ -91,8 +137,11 @@ def structure_json(contents):
     for filename, sections in contents.items():
         hierarchy[filename] = {}
 
-        # list to track parent sections for potential nesting
-        parent_stack = []
+        # parallel lists tracking parent sections for potential nesting;
+        # keeping the levels in their own list means the pop loop
+        # compares plain ints instead of indexing into each parent dict
+        parent_sections = []
+        parent_levels = []
 
         for section_title, section_data in sections.items():
             level = section_data['level']
@@ -108,18 +157,20 @@ def structure_json(contents):
 
             # Ensure only sections with a level greater than the current
             # section remain in the stack as potential parents
-            while parent_stack and parent_stack[-1]['level'] >= level:
-                parent_stack.pop()
+            while parent_levels and parent_levels[-1] >= level:
+                parent_levels.pop()
+                parent_sections.pop()
 
-            if parent_stack:
+            if parent_sections:
                 # Add the section as a child of the last parent
-                parent_stack[-1]['sub-sections'].append(section_info)
+                parent_sections[-1]['sub-sections'].append(section_info)
             else:
                 # Add the section as a top-level section
                 hierarchy[filename][section_title] = section_info
 
             # Add the current section to the parent stack for future nesting
-            parent_stack.append(section_info)
+            parent_sections.append(section_info)
+            parent_levels.append(level)
 
     def remove_blank_subsections(sections):
         seek = 'sub-sections'
@@ -155,6 +206,23 @@ def structure_json(contents):
     return hierarchy
 
 
+def _flush_aggregated(parts, out):
+    """Emit any aggregated plain-text/stream output fragments as a
+    single output-cell div and clear the aggregation list."""
+    if parts:
+        out.append("".join((
+            "<div class='output-cell'>"
+            "<div class='output-label'>"
+            "\n\tOut:"
+            "\n</div>"
+            "\n\t<div class='output-code'>",
+            *parts,
+            "\n\t</div>"
+            "\n</div>",
+        )))
+        parts.clear()
+
+
 def extract_html_from_notebook(
         notebook,
         input_dir,
@@ -162,12 +230,26 @@ def extract_html_from_notebook(
         use_base64=False
         ):
     """Extracts HTML for cell contents and outputs,
-    including code and markdown."""
+    including code and markdown.
+
+    Returns the list of html fragments (joined with newlines when a
+    full document is needed) along with the list of (line number,
+    level, title) tuples for the header tags they contain, so
+    downstream json conversion does not need to rediscover them."""
 
     html_output = []
     fig_id = 0
     delim = os.path.sep
-    aggregated_output = ""
+
+    # folder for figure files, computed once per notebook; it is only
+    # created on disk when the first image output is encountered
+    output_folder = "output_nb_" + \
+        f"{filename.split('.ipynb')[0]}"
+    output_dir = f"{input_dir}{delim}{output_folder}"
+    output_dir_created = False
+    # aggregated plain-text/stream outputs are collected in a list and
+    # joined once per emit, rather than repeatedly concatenated
+    aggregated_output = []
 
     for cell in notebook["cells"]:
         if cell["cell_type"] == "code":
@@ -187,36 +269,31 @@ def extract_html_from_notebook(
                     text_output = output["data"]["text/plain"]
                     # escape the '<' and '>' characters which can be
                     # incorrectly interpreted as HTML tags
-                    escaped_text_output = html.escape(text_output)
+                    escaped_text_output = text_output.translate(
+                        _HTML_ESCAPE_TABLE
+                    )
 
                     # Aggregate plain text outputs
-                    aggregated_output += f"\n\t\t{escaped_text_output}"
+                    aggregated_output.append(f"\n\t\t{escaped_text_output}")
 
                 # handle stdout (e.g., outputs from print statements)
                 if output.get("output_type") == "stream" \
                         and output.get("name") == "stdout":
                     stream_output = output.get("text", "")
                     # escape < and > characters
-                    escaped_stream_output = html.escape(stream_output)
+                    escaped_stream_output = stream_output.translate(
+                        _HTML_ESCAPE_TABLE
+                    )
 
-                    aggregated_output += f"\n\t\t{escaped_stream_output}"
+                    aggregated_output.append(
+                        f"\n\t\t{escaped_stream_output}"
+                    )
 
                 # handle image outputs (e.g., plots) using either Base64
                 # encoding or .png files
                 if "image/png" in output.get("data", {}):
                     # If there are accumulated outputs, output them first
-                    if aggregated_output:
-                        html_output.append(
-                            "<div class='output-cell'>"
-                            "<div class='output-label'>"
-                            "\n\tOut:"
-                            "\n</div>"
-                            "\n\t<div class='output-code'>"
-                            f"{aggregated_output}"
-                            "\n\t</div>"
-                            "\n</div>"
-                        )
-                        aggregated_output = ""
+                    _flush_aggregated(aggregated_output, html_output)
 
                     img_data = output["data"]["image/png"]
 
@@ -231,18 +308,11 @@ def extract_html_from_notebook(
                     else:
                         # save the image as a file and reference it in HTML
                         fig_id += 1
-                        if fig_id <= 10:
-                            img_filename = f"fig_0{fig_id}.png"
-                        else:
-                            img_filename = f"fig_{fig_id}.png"
+                        img_filename = f"fig_{fig_id:02d}.png"
 
-                        output_folder = "output_nb_" + \
-                            f"{filename.split('.ipynb')[0]}"
-
-                        output_dir = f"{input_dir}{delim}{output_folder}"
-
-                        if not os.path.exists(output_dir):
-                            os.makedirs(output_dir)
+                        if not output_dir_created:
+                            os.makedirs(output_dir, exist_ok=True)
+                            output_dir_created = True
 
                         save_plot_as_image(
                             img_data,
@@ -269,22 +339,11 @@ def extract_html_from_notebook(
 
             # If there are any accumulated outputs after processing all
             # outputs for the cell
-            if aggregated_output:
-                html_output.append(
-                    "<div class='output-cell'>"
-                    "<div class='output-label'>"
-                    "\n\tOut:"
-                    "\n</div>"
-                    "\n\t<div class='output-code'>"
-                    f"{aggregated_output}"
-                    "\n\t</div>"
-                    "\n</div>"
-                )
-                aggregated_output = ""
+            _flush_aggregated(aggregated_output, html_output)
 
         elif cell["cell_type"] == "markdown":
             # escape < and > characters
-            markdown_content = html.escape(cell["source"])
+            markdown_content = cell["source"].translate(_HTML_ESCAPE_TABLE)
 
             # html_content = markdown.markdown(markdown_content)
 
@@ -313,16 +372,49 @@ def extract_html_from_notebook(
                 "\n</div>"
             )
 
-    html_output = "\n".join(html_output)
+    # record header locations while the fragments are still separate,
+    # so only the (small) fragments that can contain header tags are
+    # scanned; line numbers are relative to the joined output
+    headers = []
+    line_count = 0
+    for fragment in html_output:
+        if '<h' in fragment:
+            for j, fragment_line in enumerate(fragment.split("\n")):
+                line_match = _HEADER_RE.match(
+                    fragment_line.replace("\t", "    ").strip()
+                )
+                if line_match:
+                    level = line_match.group(1).strip()
+                    level = int(level.lstrip('<h').rstrip('>'))
+                    title = line_match.group(2).strip()
+                    headers.append((line_count + j, level, title))
+        line_count += fragment.count("\n") + 1
+
+    return html_output, headers
+
+
+def load_notebook(notebook_path):
+    """Read a notebook from disk, parsing the json with orjson when it
+    is available.
+
+    nbformat.read parses with the stdlib json module and runs schema
+    validation on every load; the orjson path skips both, which matters
+    for notebooks carrying large base64 image payloads. The notebooks
+    in this repository are all v4, so the version upgrade performed by
+    nbformat.read is not needed.
+    """
+    if orjson is not None:
+        with open(notebook_path, "rb") as f:
+            return nbformat.from_dict(orjson.loads(f.read()))
 
-    return html_output
+    with open(notebook_path, "r", encoding="utf-8") as f:
+        return nbformat.read(f, as_version=4)
 
 
 def hash_notebook(notebook_path):
     """Generate a SHA256 hash of the notebook, ignoring outputs/metadata."""
 
-    with open(notebook_path, "r", encoding="utf-8") as f:
-        nb = nbformat.read(f, as_version=4)
+    nb = load_notebook(notebook_path)
 
     # clear all cell outputs
     preprocessor = ClearOutputPreprocessor()
@@ -373,8 +465,7 @@ def get_notebook(
         timeout=600,
         ):
     """Get a jupyter notebook object and optionally execute it"""
-    with open(notebook_path, "r", encoding="utf-8") as f:
-        notebook = nbformat.read(f, as_version=4)
+    notebook = load_notebook(notebook_path)
 
     if execute:
         ep = ExecutePreprocessor(
@@ -388,6 +479,36 @@ def get_notebook(
     return notebook
 
 
+def get_executed_notebook(
+        notebook_path,
+        notebook_hash,
+        cache_dir,
+        ):
+    """Get an executed notebook object, reusing a cached executed copy
+    when one exists for the notebook's current hash.
+
+    The cache is keyed by the output-independent hash from
+    `hash_notebook`, so it invalidates automatically whenever the
+    notebook source changes. After a fresh execution the executed
+    notebook is written back to the cache.
+    """
+    cached_path = os.path.join(cache_dir, f"{notebook_hash}.ipynb")
+
+    if os.path.exists(cached_path):
+        print(
+            f"Loading cached executed copy of '{notebook_path}'"
+        )
+        return get_notebook(cached_path, execute=False)
+
+    notebook = get_notebook(notebook_path, execute=True)
+
+    os.makedirs(cache_dir, exist_ok=True)
+    with open(cached_path, "w", encoding="utf-8") as f:
+        nbformat.write(notebook, f)
+
+    return notebook
+
+
 def is_notebook_fully_executed(notebook):
     """
     Check if a notebook object has been fully executed.
@@ -419,15 +540,213 @@ def notebook_has_json_output(
     return execution_check
 
 
+def process_notebook(
+        root,
+        filename,
+        notebook_hashes,
+        notebooks_to_skip,
+        use_base64=False,
+        write_html=False,
+        execute_notebooks=False,
+        cache_dir=".nb_cache",
+        ):
+    """
+    Execute (if needed) and convert a single notebook to its html and
+    json outputs. Returns the current hash of the notebook so the
+    caller can update the hash record.
+
+    This is a module-level function so it can be dispatched to worker
+    processes by convert_notebooks_to_html.
+    """
+    print(
+        f"\nProcessing notebook: {filename}"
+    )
+
+    nb_path = os.path.join(root, filename)
+
+    # short-circuit the whole pipeline when the json output is newer
+    # than both the notebook and this script: the notebook cannot have
+    # changed since its outputs were written, so re-converting it would
+    # reproduce the same files. The json must also record a complete
+    # execution, and the html output must exist when requested.
+    output_json = os.path.join(
+        root, f"{os.path.splitext(filename)[0]}.json"
+    )
+    output_html = os.path.join(
+        root, f"{os.path.splitext(filename)[0]}.html"
+    )
+    if (filename in notebook_hashes) and os.path.exists(output_json):
+        json_mtime = os.path.getmtime(output_json)
+        if json_mtime > os.path.getmtime(nb_path) \
+                and json_mtime > os.path.getmtime(__file__) \
+                and (not write_html or os.path.exists(output_html)) \
+                and notebook_has_json_output(root, filename):
+            print(
+                f"Notebook {filename} outputs are up to date;"
+                " skipping conversion"
+            )
+            return notebook_hashes[filename]
+
+    # get current hash of the notebook
+    current_hash = hash_notebook(nb_path)
+
+    # get the notebook without executing it
+    loaded_notebook = get_notebook(
+        nb_path,
+        execute=False,
+    )
+
+    # check if the notebook has been fully executed
+    notebook_executed = notebook_has_json_output(
+        root,
+        filename,
+    )
+
+    # check if notebook should be skipped
+    skip_notebook = False
+    if filename in notebooks_to_skip:
+        skip_notebook = True
+
+    # for cases where the hash has not changed
+    if skip_notebook:
+        print(
+            f"Notebook '{filename}' has been flagged to be"
+            " skipped. Execution will not be attempted for"
+            " this notebook."
+        )
+    elif (filename in notebook_hashes) and \
+            (notebook_hashes[filename] == current_hash):
+
+        # check if notebook has been fully executed
+        if not notebook_executed:
+            print(
+                f"Warning: Notebook {filename} has not been"
+                " fully executed."
+            )
+            if execute_notebooks:
+                loaded_notebook = get_executed_notebook(
+                    nb_path,
+                    current_hash,
+                    cache_dir,
+                )
+                print('Notebook has been executed')
+                notebook_executed = is_notebook_fully_executed(
+                    loaded_notebook
+                )
+            else:
+                print(
+                    "Notebook execution skipped since"
+                    " execute_notebooks is False."
+                )
+        else:
+            print(
+                f"Notebook {filename} is unchanged and already"
+                " fully executed"
+            )
+    # if the file is new (unhashed) or has been changed, execute
+    # the notebook and update the hash dict
+    else:
+        print(
+            f"Notebook {filename} is new or has been updated and"
+            " needs to be executed"
+        )
+        if execute_notebooks:
+            loaded_notebook = get_executed_notebook(
+                nb_path,
+                current_hash,
+                cache_dir,
+            )
+            print(
+                "Notebook has been executed"
+            )
+            notebook_executed = is_notebook_fully_executed(
+                loaded_notebook
+            )
+
+        else:
+            print(
+                "Skipping notebook execution since"
+                " execute_notebook is False"
+            )
+
+    # extract and process the html from the notebook
+    nb_fragments, nb_headers = extract_html_from_notebook(
+        loaded_notebook,
+        root,
+        filename,
+        use_base64,
+    )
+
+    # optionally write the converted notebook to a
+    # standalone html file; this is the only consumer that needs the
+    # fragments joined into a full document
+    if write_html:
+        with open(output_html, "w", encoding="utf-8") as f:
+            f.write("<html><body>\n")
+            f.write("\n".join(nb_fragments))
+            f.write("\n</body></html>")
+
+    # ----------------------------------------
+    # generated structured json output
+    # ----------------------------------------
+    # Note: this section pertains to a planned enhancement
+    # to enable inserting sections of a notebook into an
+    # html file by specifing the headers to include; e.g.,
+    # including [[notebook][start header][end header]] in your
+    # .md file would inject only the .html for those header
+    # sections into your html output file
+
+    nb_html_json = html_to_json(
+        nb_fragments,
+        filename,
+        headers=nb_headers,
+    )
+
+    # Add execution status directly to json output
+    nb_html_json = {
+        "full_executed": notebook_executed,
+        **nb_html_json,
+    }
+
+    if orjson is not None:
+        # orjson produces bytes, so the file is opened in binary mode
+        with open(output_json, "wb") as f:
+            f.write(orjson.dumps(nb_html_json, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_json, "w") as f:
+            json.dump(nb_html_json, f, indent=4)
+    # ----------------------------------------
+
+    print(
+        f"Successfully converted '{filename}'to html"
+    )
+
+    if not skip_notebook and not notebook_executed:
+        print(
+            f"Warning: the html and json outputs for '{filename}'"
+            " may be incomplete."
+            "\nPlease re-run the script with"
+            " 'execute_notebooks=True' to ensure that the"
+            " notebook outputs are correct."
+        )
+
+    return current_hash
+
+
 def convert_notebooks_to_html(
         input_folder=None,
         use_base64=False,
         write_html=False,
         execute_notebooks=False,
         hash_path="notebook_hashes.json",
+        cache_dir=".nb_cache",
         ):
     """
     Executes and converts .ipynb files in the input folder to HTML.
+
+    Notebooks are processed in parallel with one worker process per
+    notebook (up to the cpu count), since each notebook is executed in
+    its own kernel subprocess and converted independently.
     """
 
     if not input_folder:
@@ -446,157 +765,27 @@ def convert_notebooks_to_html(
         notebooks_to_skip = json.load(f)
     notebooks_to_skip = notebooks_to_skip['skip_execution']
 
-    # iterate through input directory and process notebooks
-    for root, list_folders, list_files in os.walk(input_folder):
-        for filename in list_files:
-            if filename.endswith(".ipynb"):
-                print(
-                    f"\nProcessing notebook: {filename}"
-                )
-
-                # get current hash of the notebook
-                nb_path = os.path.join(root, filename)
-                current_hash = hash_notebook(nb_path)
-
-                # get the notebook without executing it
-                loaded_notebook = get_notebook(
-                    nb_path,
-                    execute=False,
-                )
-
-                # check if the notebook has been fully executed
-                notebook_executed = notebook_has_json_output(
-                    root,
-                    filename,
-                )
-
-                # check if notebook should be skipped
-                skip_notebook = False
-                if filename in notebooks_to_skip:
-                    skip_notebook = True
-
-                # for cases where the hash has not changed
-                if skip_notebook:
-                    print(
-                        f"Notebook '{filename}' has been flagged to be"
-                        " skipped. Execution will not be attempted for"
-                        " this notebook."
-                    )
-                elif (filename in notebook_hashes) and \
-                        (notebook_hashes[filename] == current_hash):
-
-                    # check if notebook has been fully executed
-                    if not notebook_executed:
-                        print(
-                            f"Warning: Notebook {filename} has not been"
-                            " fully executed."
-                        )
-                        if execute_notebooks:
-                            loaded_notebook = get_notebook(
-                                nb_path,
-                                execute=True,
-                            )
-                            print('Notebook has been executed')
-                            notebook_executed = is_notebook_fully_executed(
-                                loaded_notebook
-                            )
-                        else:
-                            print(
-                                "Notebook execution skipped since"
-                                " execute_notebooks is False."
-                            )
-                    else:
-                        print(
-                            f"Notebook {filename} is unchanged and already"
-                            " fully executed"
-                        )
-                # if the file is new (unhashed) or has been changed, execute
-                # the notebook and update the hash dict
-                else:
-                    print(
-                        f"Notebook {filename} is new or has been updated and"
-                        " needs to be executed"
-                    )
-                    if execute_notebooks:
-                        loaded_notebook = get_notebook(
-                            nb_path,
-                            execute=True,
-                        )
-                        print(
-                            "Notebook has been executed"
-                        )
-                        notebook_executed = is_notebook_fully_executed(
-                            loaded_notebook
-                        )
-
-                    else:
-                        print(
-                            "Skipping notebook execution since"
-                            " execute_notebook is False"
-                        )
-
-                # update the hash dictionary
-                updated_hashes[filename] = current_hash
-
-                # extract and process the html from the notebook
-                html_content = extract_html_from_notebook(
-                    loaded_notebook,
-                    root,
-                    filename,
-                    use_base64,
-                )
-
-                # optionally write the converted notebook to a
-                # standalone html file
-                if write_html:
-                    output_file = os.path.join(
-                        root, f"{os.path.splitext(filename)[0]}.html"
+    # iterate through input directory and process notebooks in parallel
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        futures = {}
+        for root, list_folders, list_files in os.walk(input_folder):
+            for filename in list_files:
+                if filename.endswith(".ipynb"):
+                    future = executor.submit(
+                        process_notebook,
+                        root,
+                        filename,
+                        notebook_hashes,
+                        notebooks_to_skip,
+                        use_base64,
+                        write_html,
+                        execute_notebooks,
+                        cache_dir,
                     )
-                    with open(output_file, "w", encoding="utf-8") as f:
-                        f.write("<html><body>\n")
-                        f.write(html_content)
-                        f.write("\n</body></html>")
-
-                # ----------------------------------------
-                # generated structured json output
-                # ----------------------------------------
-                # Note: this section pertains to a planned enhancement
-                # to enable inserting sections of a notebook into an
-                # html file by specifing the headers to include; e.g.,
-                # including [[notebook][start header][end header]] in your
-                # .md file would inject only the .html for those header
-                # sections into your html output file
-
-                nb_html_json = html_to_json(
-                    html_content,
-                    filename,
-                )
-
-                # Add execution status directly to json output
-                nb_html_json = {
-                    "full_executed": notebook_executed,
-                    **nb_html_json,
-                }
-
-                output_json = os.path.join(
-                    root, f"{os.path.splitext(filename)[0]}.json"
-                )
-                with open(output_json, "w") as f:
-                    json.dump(nb_html_json, f, indent=4)
-                # ----------------------------------------
+                    futures[future] = filename
 
-                print(
-                    f"Successfully converted '{filename}'to html"
-                )
-
-                if not skip_notebook and not notebook_executed:
-                    print(
-                        f"Warning: the html and json outputs for '{filename}'"
-                        " may be incomplete."
-                        "\nPlease re-run the script with"
-                        " 'execute_notebooks=True' to ensure that the"
-                        " notebook outputs are correct."
-                    )
+        for future in as_completed(futures):
+            updated_hashes[futures[future]] = future.result()
 
     # save updated hashes
     save_notebook_hashes(